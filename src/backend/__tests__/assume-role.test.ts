@@ -0,0 +1,96 @@
+import { STSClient, AssumeRoleCommand } from "@aws-sdk/client-sts";
+import { getRoleCredentials, MIN_REMAINING_MS } from '../assume-role';
+
+const MINUTE = 60 * 1000;
+const ROLE_ARN = 'arn:aws:iam::123456789012:role/DeployHub';
+
+// Stub STS client whose AssumeRole calls return one-hour credentials issued at the mocked current time
+function stubSts() {
+  let issued = 0;
+  const send = jest.fn(async (command: AssumeRoleCommand) => {
+    issued++;
+    return {
+      Credentials: {
+        AccessKeyId: `AKIA${issued}`,
+        SecretAccessKey: 'secret',
+        SessionToken: 'token',
+        Expiration: new Date(Date.now() + command.input.DurationSeconds! * 1000),
+      },
+    };
+  });
+  return { client: { send } as unknown as STSClient, send };
+}
+
+describe('getRoleCredentials', () => {
+  let now: number;
+  let userCount = 0;
+  let userId: string;
+
+  beforeEach(() => {
+    now = Date.UTC(2025, 0, 1);
+    jest.spyOn(Date, 'now').mockImplementation(() => now);
+    // A distinct user per test keeps the module-level cache from leaking between tests
+    userId = `user-${++userCount}`;
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('serves cached credentials while at least 45 minutes remain', async () => {
+    const { client, send } = stubSts();
+    const first = await getRoleCredentials(client, ROLE_ARN, 'external', userId);
+
+    now += 60 * MINUTE - MIN_REMAINING_MS;
+    const second = await getRoleCredentials(client, ROLE_ARN, 'external', userId);
+
+    expect(MIN_REMAINING_MS).toBe(45 * MINUTE);
+    expect(send).toHaveBeenCalledTimes(1);
+    expect(second).toBe(first);
+  });
+
+  it('assumes the role again once under 45 minutes remain', async () => {
+    const { client, send } = stubSts();
+    await getRoleCredentials(client, ROLE_ARN, 'external', userId);
+
+    now += 60 * MINUTE - MIN_REMAINING_MS + 1;
+    const refreshed = await getRoleCredentials(client, ROLE_ARN, 'external', userId);
+
+    expect(send).toHaveBeenCalledTimes(2);
+    expect(refreshed?.AccessKeyId).toBe('AKIA2');
+    expect(refreshed!.Expiration!.getTime() - now).toBe(60 * MINUTE);
+  });
+
+  it('never serves expired credentials', async () => {
+    const { client, send } = stubSts();
+    await getRoleCredentials(client, ROLE_ARN, 'external', userId);
+
+    now += 2 * 60 * MINUTE;
+    const refreshed = await getRoleCredentials(client, ROLE_ARN, 'external', userId);
+
+    expect(send).toHaveBeenCalledTimes(2);
+    expect(refreshed!.Expiration!.getTime()).toBeGreaterThan(now);
+  });
+
+  it('shares one AssumeRole call between concurrent requests', async () => {
+    const { client, send } = stubSts();
+
+    const [first, second] = await Promise.all([
+      getRoleCredentials(client, ROLE_ARN, 'external', userId),
+      getRoleCredentials(client, ROLE_ARN, 'external', userId),
+    ]);
+
+    expect(send).toHaveBeenCalledTimes(1);
+    expect(second).toBe(first);
+  });
+
+  it('caches credentials per user, role and external ID', async () => {
+    const { client, send } = stubSts();
+
+    await getRoleCredentials(client, ROLE_ARN, 'external', userId);
+    await getRoleCredentials(client, ROLE_ARN, 'other-external', userId);
+    await getRoleCredentials(client, ROLE_ARN, 'external', `${userId}-other`);
+
+    expect(send).toHaveBeenCalledTimes(3);
+  });
+});
@@ -0,0 +1,78 @@
+import { runConcurrently } from '../async-utils';
+
+const delay = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+describe('runConcurrently', () => {
+  it('never runs more than `concurrency` workers at once', async () => {
+    let inFlight = 0;
+    let maxInFlight = 0;
+    const processed: number[] = [];
+
+    await runConcurrently([1, 2, 3, 4, 5, 6, 7, 8, 9, 10].values(), 3, async (item) => {
+      inFlight++;
+      maxInFlight = Math.max(maxInFlight, inFlight);
+      await delay(1);
+      processed.push(item);
+      inFlight--;
+    });
+
+    expect(maxInFlight).toBe(3);
+    expect(processed.sort((a, b) => a - b)).toEqual([1, 2, 3, 4, 5, 6, 7, 8, 9, 10]);
+  });
+
+  it('stops pulling new items after the first failure and rethrows it once in-flight work settles', async () => {
+    const pulled: number[] = [];
+    let closed = false;
+    function* items() {
+      try {
+        for (let i = 1; i <= 10; i++) {
+          pulled.push(i);
+          yield i;
+        }
+      } finally {
+        closed = true;
+      }
+    }
+
+    let slowWorkerFinished = false;
+    await expect(runConcurrently(items(), 2, async (item) => {
+      if (item === 1) {
+        throw new Error('boom');
+      }
+      await delay(5);
+      slowWorkerFinished = true;
+    })).rejects.toThrow('boom');
+
+    expect(slowWorkerFinished).toBe(true);
+    expect(pulled).toEqual([1, 2]);
+    expect(closed).toBe(true);
+  });
+
+  it('rethrows the first failure when several workers fail', async () => {
+    await expect(runConcurrently([1, 2].values(), 2, async (item) => {
+      await delay(item === 1 ? 1 : 5);
+      throw new Error(`failed ${item}`);
+    })).rejects.toThrow('failed 1');
+  });
+
+  it('consumes async generators lazily', async () => {
+    const pulled: string[] = [];
+    async function* items() {
+      for (const item of ['a', 'b', 'c', 'd']) {
+        await delay(1);
+        pulled.push(item);
+        yield item;
+      }
+    }
+
+    const processed: string[] = [];
+    await runConcurrently(items(), 2, async (item) => {
+      // Only items handed to a worker have been produced so far
+      expect(pulled.length).toBeLessThanOrEqual(processed.length + 2);
+      await delay(1);
+      processed.push(item);
+    });
+
+    expect(processed.sort()).toEqual(['a', 'b', 'c', 'd']);
+  });
+});
@@ -0,0 +1,51 @@
+import { resolveDeleteBatchSize } from '../cleanup-project';
+
+describe('resolveDeleteBatchSize', () => {
+  const originalBatchSize = process.env.S3_DELETE_BATCH_SIZE;
+
+  afterEach(() => {
+    if (originalBatchSize === undefined) {
+      delete process.env.S3_DELETE_BATCH_SIZE;
+    } else {
+      process.env.S3_DELETE_BATCH_SIZE = originalBatchSize;
+    }
+  });
+
+  it('defaults to the S3 maximum of 1000', () => {
+    delete process.env.S3_DELETE_BATCH_SIZE;
+    expect(resolveDeleteBatchSize()).toBe(1000);
+    process.env.S3_DELETE_BATCH_SIZE = '';
+    expect(resolveDeleteBatchSize()).toBe(1000);
+  });
+
+  it('uses the request value ahead of the environment', () => {
+    process.env.S3_DELETE_BATCH_SIZE = '100';
+    expect(resolveDeleteBatchSize()).toBe(100);
+    expect(resolveDeleteBatchSize(250)).toBe(250);
+    expect(resolveDeleteBatchSize('300')).toBe(300);
+  });
+
+  it('clamps to at most 1000 and drops fractions', () => {
+    expect(resolveDeleteBatchSize(5000)).toBe(1000);
+    expect(resolveDeleteBatchSize(12.7)).toBe(12);
+    expect(resolveDeleteBatchSize(0.5)).toBe(1);
+  });
+
+  it('treats invalid request values as absent', () => {
+    process.env.S3_DELETE_BATCH_SIZE = '100';
+    for (const invalid of ['', '  ', true, false, null, 0, -3, 'abc', NaN, Infinity, {}]) {
+      expect(resolveDeleteBatchSize(invalid)).toBe(100);
+    }
+
+    delete process.env.S3_DELETE_BATCH_SIZE;
+    expect(resolveDeleteBatchSize('')).toBe(1000);
+    expect(resolveDeleteBatchSize(true)).toBe(1000);
+  });
+
+  it('falls back to 1000 for invalid environment values', () => {
+    for (const invalid of ['lots', '0', '-5', 'Infinity']) {
+      process.env.S3_DELETE_BATCH_SIZE = invalid;
+      expect(resolveDeleteBatchSize()).toBe(1000);
+    }
+  });
+});
@@ -0,0 +1,30 @@
+import { getContentType, getObjectMetadata } from '../content-types';
+
+describe('getContentType', () => {
+  it('maps known extensions case-insensitively', () => {
+    expect(getContentType('index.html')).toBe('text/html');
+    expect(getContentType('assets/App.CSS')).toBe('text/css');
+    expect(getContentType('static/js/main.mjs')).toBe('application/javascript');
+    expect(getContentType('logo.JPEG')).toBe('image/jpeg');
+  });
+
+  it('falls back to application/octet-stream', () => {
+    expect(getContentType('Makefile')).toBe('application/octet-stream');
+    expect(getContentType('archive.tar.gz')).toBe('application/octet-stream');
+    expect(getContentType('.env')).toBe('application/octet-stream');
+  });
+});
+
+describe('getObjectMetadata', () => {
+  it('makes HTML revalidate and caches other assets long-term', () => {
+    expect(getObjectMetadata('index.HTML')).toEqual({
+      contentType: 'text/html',
+      cacheControl: 'public, max-age=0, must-revalidate',
+    });
+    expect(getObjectMetadata('assets/app.js')).toEqual({
+      contentType: 'application/javascript',
+      cacheControl: 'public, max-age=31536000, immutable',
+    });
+    expect(getObjectMetadata('data.bin').contentType).toBe('application/octet-stream');
+  });
+});
@@ -0,0 +1,37 @@
+import { LruCache } from '../lru';
+
+describe('LruCache', () => {
+  it('evicts the least recently inserted entry once over capacity', () => {
+    const cache = new LruCache<string, number>(2);
+    cache.set('a', 1);
+    cache.set('b', 2);
+    cache.set('c', 3);
+
+    expect(cache.size).toBe(2);
+    expect(cache.get('a')).toBeUndefined();
+    expect(cache.get('b')).toBe(2);
+    expect(cache.get('c')).toBe(3);
+  });
+
+  it('treats a read as a use, so recently read entries survive eviction', () => {
+    const cache = new LruCache<string, number>(2);
+    cache.set('a', 1);
+    cache.set('b', 2);
+    cache.get('a');
+    cache.set('c', 3);
+
+    expect(cache.get('a')).toBe(1);
+    expect(cache.get('b')).toBeUndefined();
+  });
+
+  it('replaces an existing key without evicting anything else', () => {
+    const cache = new LruCache<string, number>(2);
+    cache.set('a', 1);
+    cache.set('b', 2);
+    cache.set('a', 10);
+
+    expect(cache.size).toBe(2);
+    expect(cache.get('a')).toBe(10);
+    expect(cache.get('b')).toBe(2);
+  });
+});
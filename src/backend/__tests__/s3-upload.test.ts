@@ -0,0 +1,105 @@
+import {
+  S3Client,
+  PutObjectCommand,
+  CreateMultipartUploadCommand,
+  UploadPartCommand,
+  CompleteMultipartUploadCommand,
+  AbortMultipartUploadCommand
+} from "@aws-sdk/client-s3";
+import { uploadObject } from '../s3-upload';
+
+const MB = 1024 * 1024;
+const delay = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+// Stub S3Client whose send() records every command and delegates UploadPart to `onPart`
+function stubClient(onPart: (partNumber: number) => Promise<void> = async () => undefined) {
+  const commands: unknown[] = [];
+  const events: string[] = [];
+  const send = jest.fn(async (command: unknown) => {
+    commands.push(command);
+    if (command instanceof CreateMultipartUploadCommand) {
+      return { UploadId: 'upload-1' };
+    }
+    if (command instanceof UploadPartCommand) {
+      const partNumber = command.input.PartNumber!;
+      await onPart(partNumber);
+      events.push(`part-${partNumber}`);
+      return { ETag: `etag-${partNumber}` };
+    }
+    if (command instanceof AbortMultipartUploadCommand) {
+      events.push('abort');
+    }
+    return {};
+  });
+  return { client: { send } as unknown as S3Client, commands, events };
+}
+
+const partsOf = (commands: unknown[]) => commands.filter((command): command is UploadPartCommand => command instanceof UploadPartCommand);
+
+describe('uploadObject', () => {
+  it('uses a single PutObject below the 8MB threshold', async () => {
+    const { client, commands } = stubClient();
+    const body = Buffer.alloc(8 * MB - 1);
+
+    await uploadObject(client, { Bucket: 'bucket', Key: 'small.js', Body: body, ContentType: 'application/javascript' });
+
+    expect(commands).toHaveLength(1);
+    expect(commands[0]).toBeInstanceOf(PutObjectCommand);
+    expect((commands[0] as PutObjectCommand).input).toMatchObject({ Bucket: 'bucket', Key: 'small.js', ContentType: 'application/javascript' });
+  });
+
+  it('switches to multipart at exactly 8MB', async () => {
+    const { client, commands } = stubClient();
+
+    await uploadObject(client, { Bucket: 'bucket', Key: 'edge.bin', Body: Buffer.alloc(8 * MB) });
+
+    expect(commands[0]).toBeInstanceOf(CreateMultipartUploadCommand);
+    expect(partsOf(commands)).toHaveLength(1);
+    expect(partsOf(commands)[0].input.Body).toHaveLength(8 * MB);
+  });
+
+  it('splits into 16MB parts and completes them in part-number order', async () => {
+    // Later parts finish first, so completion order differs from part order
+    const { client, commands } = stubClient(partNumber => delay(10 - partNumber * 3));
+    const body = Buffer.alloc(37 * MB);
+    body[0] = 1;
+    body[16 * MB] = 2;
+    body[32 * MB] = 3;
+
+    await uploadObject(client, { Bucket: 'bucket', Key: 'large.bin', Body: body, CacheControl: 'no-cache' });
+
+    const createInput = (commands[0] as CreateMultipartUploadCommand).input;
+    expect(createInput).toEqual({ Bucket: 'bucket', Key: 'large.bin', CacheControl: 'no-cache' });
+
+    const parts = partsOf(commands).sort((a, b) => a.input.PartNumber! - b.input.PartNumber!);
+    expect(parts.map(part => part.input.PartNumber)).toEqual([1, 2, 3]);
+    expect(parts.map(part => (part.input.Body as Buffer).length)).toEqual([16 * MB, 16 * MB, 5 * MB]);
+    expect(parts.map(part => (part.input.Body as Buffer)[0])).toEqual([1, 2, 3]);
+
+    const complete = commands[commands.length - 1] as CompleteMultipartUploadCommand;
+    expect(complete).toBeInstanceOf(CompleteMultipartUploadCommand);
+    expect(complete.input.UploadId).toBe('upload-1');
+    expect(complete.input.MultipartUpload?.Parts).toEqual([
+      { ETag: 'etag-1', PartNumber: 1 },
+      { ETag: 'etag-2', PartNumber: 2 },
+      { ETag: 'etag-3', PartNumber: 3 },
+    ]);
+  });
+
+  it('aborts only after every in-flight part has settled', async () => {
+    const { client, commands, events } = stubClient(async (partNumber) => {
+      if (partNumber === 2) {
+        throw new Error('part 2 failed');
+      }
+      await delay(partNumber === 1 ? 20 : 5);
+    });
+
+    await expect(uploadObject(client, { Bucket: 'bucket', Key: 'large.bin', Body: Buffer.alloc(40 * MB) }))
+      .rejects.toThrow('part 2 failed');
+
+    expect(events).toEqual(['part-3', 'part-1', 'abort']);
+    expect(commands.some(command => command instanceof CompleteMultipartUploadCommand)).toBe(false);
+    expect((commands[commands.length - 1] as AbortMultipartUploadCommand).input)
+      .toEqual({ Bucket: 'bucket', Key: 'large.bin', UploadId: 'upload-1' });
+  });
+});
@@ -1,4 +1,64 @@
-import { STSClient, AssumeRoleCommand } from "@aws-sdk/client-sts";
+import { STSClient, AssumeRoleCommand, Credentials } from "@aws-sdk/client-sts";
+import { getSTSClient } from './aws-clients';
+import { LruCache } from './lru';
+
+interface CachedRoleCredentials {
+  current?: { credentials: Credentials; expiresAt: number };
+  pending?: Promise<Credentials | undefined>;
+}
+
+// Assumed-role credentials are reused while most of their lifetime is left, since AssumeRole can take seconds.
+// The frontend disconnects once the credentials it was handed expire, so only serve sessions that still
+// have at least 45 of their 60 minutes left; anything older is replaced before responding.
+const MAX_CACHED_ROLES = 512;
+const roleCredentialCache = new LruCache<string, CachedRoleCredentials>(MAX_CACHED_ROLES);
+export const MIN_REMAINING_MS = 45 * 60 * 1000;
+
+function refreshRoleCredentials(
+  stsClient: STSClient,
+  cacheKey: string,
+  entry: CachedRoleCredentials,
+  roleArn: string,
+  externalId: string
+): Promise<Credentials | undefined> {
+  // Concurrent callers for the same role share a single AssumeRole call
+  if (!entry.pending) {
+    entry.pending = stsClient.send(new AssumeRoleCommand({
+      RoleArn: roleArn,
+      ExternalId: externalId,
+      RoleSessionName: `deployhub-${Date.now()}`,
+      DurationSeconds: 3600, // 1 hour
+    })).then((result) => {
+      if (result.Credentials?.Expiration) {
+        entry.current = { credentials: result.Credentials, expiresAt: result.Credentials.Expiration.getTime() };
+      }
+      return result.Credentials;
+    }).finally(() => {
+      entry.pending = undefined;
+    });
+
+    roleCredentialCache.set(cacheKey, entry);
+  }
+  return entry.pending;
+}
+
+export async function getRoleCredentials(
+  stsClient: STSClient,
+  roleArn: string,
+  externalId: string,
+  userId: string
+): Promise<Credentials | undefined> {
+  const cacheKey = `${userId}|${roleArn}|${externalId}`;
+  const entry = roleCredentialCache.get(cacheKey) ?? {};
+  const remaining = entry.current ? entry.current.expiresAt - Date.now() : 0;
+
+  if (entry.current && remaining >= MIN_REMAINING_MS) {
+    return entry.current.credentials;
+  }
+
+  // Refresh in the foreground: background work is frozen between Lambda invocations
+  return refreshRoleCredentials(stsClient, cacheKey, entry, roleArn, externalId);
+}
 
 // AWS Lambda handler for role assumption
 export async function assumeRole(event: { httpMethod: string; body?: string }): Promise<{ statusCode: number; headers: Record<string, string>; body: string }> {
@@ -56,19 +116,12 @@ export async function assumeRole(event: { httpMethod: string; body?: string }):
 
     // Create STS client using the Lambda's IAM role (no explicit credentials needed)
     // The Lambda execution role will have permission to assume user roles
-    const stsClient = new STSClient({ 
-      region: process.env.AWS_REGION || 'us-east-1'
-    });
+    const stsClient = getSTSClient(process.env.AWS_REGION || 'us-east-1');
 
-    // Assume the user's role
-    const assumeRoleResult = await stsClient.send(new AssumeRoleCommand({
-      RoleArn: roleArn,
-      ExternalId: externalId,
-      RoleSessionName: `deployhub-${Date.now()}`,
-      DurationSeconds: 3600, // 1 hour
-    }));
+    // Assume the user's role (served from cache while the credentials are fresh)
+    const credentials = await getRoleCredentials(stsClient, roleArn, externalId, userId);
 
-    if (!assumeRoleResult.Credentials) {
+    if (!credentials) {
       return {
         statusCode: 500,
         headers,
@@ -85,10 +138,10 @@ export async function assumeRole(event: { httpMethod: string; body?: string }):
       body: JSON.stringify({
         success: true,
         credentials: {
-          accessKeyId: assumeRoleResult.Credentials.AccessKeyId,
-          secretAccessKey: assumeRoleResult.Credentials.SecretAccessKey,
-          sessionToken: assumeRoleResult.Credentials.SessionToken,
-          expiration: assumeRoleResult.Credentials.Expiration,
+          accessKeyId: credentials.AccessKeyId,
+          secretAccessKey: credentials.SecretAccessKey,
+          sessionToken: credentials.SessionToken,
+          expiration: credentials.Expiration,
         },
       })
     };
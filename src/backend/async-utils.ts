@@ -0,0 +1,37 @@
+// Run `worker` over every item produced by `items` with at most `concurrency` calls in flight.
+// Items are pulled lazily, so large inputs (e.g. extracted ZIP entries) are never fully buffered.
+// The first failure stops further items from being started; it is rethrown only once every
+// in-flight worker has settled, so callers never clean up while work is still running.
+export async function runConcurrently<T>(
+  items: AsyncIterator<T> | Iterator<T>,
+  concurrency: number,
+  worker: (item: T) => Promise<void>
+): Promise<void> {
+  let failure: { error: unknown } | undefined;
+
+  const runners = Array.from({ length: Math.max(1, concurrency) }, async () => {
+    try {
+      while (!failure) {
+        const next = await items.next();
+        if (next.done) {
+          return;
+        }
+        await worker(next.value);
+      }
+    } catch (error) {
+      failure ??= { error };
+    }
+  });
+
+  await Promise.all(runners);
+
+  if (failure) {
+    // Close the source (e.g. a generator or paginator) rather than leaving it suspended
+    try {
+      await items.return?.();
+    } catch {
+      // The worker failure is the one worth reporting
+    }
+    throw failure.error;
+  }
+}
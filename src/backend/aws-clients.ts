@@ -0,0 +1,76 @@
+import { createHash } from 'crypto';
+import { Agent } from 'https';
+import { S3Client } from "@aws-sdk/client-s3";
+import { CloudFrontClient } from "@aws-sdk/client-cloudfront";
+import { STSClient } from "@aws-sdk/client-sts";
+import { LruCache } from './lru';
+
+export interface AWSCredentials {
+  accessKeyId: string;
+  secretAccessKey: string;
+  sessionToken?: string;
+}
+
+// Clients are reused across requests so their connection pools (and TLS sessions) survive.
+// Evicted clients are not destroyed since a request may still hold them.
+const MAX_CACHED_CLIENTS = 256;
+const clientCache = new LruCache<string, unknown>(MAX_CACHED_CLIENTS);
+
+// Fingerprint credentials so cache keys never hold secrets in plaintext
+function cacheKey(service: string, region: string, credentials?: AWSCredentials): string {
+  const fingerprint = credentials
+    ? createHash('sha256')
+        .update(`${credentials.accessKeyId}:${credentials.secretAccessKey}:${credentials.sessionToken ?? ''}`)
+        .digest('hex')
+    : 'default';
+  return `${service}:${region}:${fingerprint}`;
+}
+
+function getCachedClient<T>(service: string, region: string, credentials: AWSCredentials | undefined, create: () => T): T {
+  const key = cacheKey(service, region, credentials);
+  const cached = clientCache.get(key) as T | undefined;
+
+  if (cached) {
+    return cached;
+  }
+
+  const client = create();
+  clientCache.set(key, client);
+  return client;
+}
+
+// Adaptive retries rate-limit client-side on throttling (e.g. S3 503 SlowDown under parallel uploads)
+const RETRY_MODE = 'adaptive';
+const MAX_ATTEMPTS = 10;
+
+// One keep-alive socket pool shared by every client, sized for the parallel upload/delete pools
+const httpsAgent = new Agent({ keepAlive: true, maxSockets: 64 });
+
+function clientConfig(region: string, credentials?: AWSCredentials) {
+  return {
+    region,
+    retryMode: RETRY_MODE,
+    maxAttempts: MAX_ATTEMPTS,
+    requestHandler: { httpsAgent },
+    ...(credentials && {
+      credentials: {
+        accessKeyId: credentials.accessKeyId,
+        secretAccessKey: credentials.secretAccessKey,
+        sessionToken: credentials.sessionToken,
+      },
+    }),
+  };
+}
+
+export function getS3Client(region: string, credentials: AWSCredentials): S3Client {
+  return getCachedClient('s3', region, credentials, () => new S3Client(clientConfig(region, credentials)));
+}
+
+export function getCloudFrontClient(region: string, credentials: AWSCredentials): CloudFrontClient {
+  return getCachedClient('cloudfront', region, credentials, () => new CloudFrontClient(clientConfig(region, credentials)));
+}
+
+// Without credentials the client uses the default provider chain (e.g. the Lambda execution role)
+export function getSTSClient(region: string, credentials?: AWSCredentials): STSClient {
+  return getCachedClient('sts', region, credentials, () => new STSClient(clientConfig(region, credentials)));
+}
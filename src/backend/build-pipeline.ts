@@ -1,8 +1,10 @@
 import { exec } from 'child_process';
 import { promisify } from 'util';
-import { writeFile, mkdir, rm, readdir, stat } from 'fs/promises';
-import { join, resolve } from 'path';
+import { writeFile, mkdir, mkdtemp, rm, readdir, stat } from 'fs/promises';
+import { tmpdir } from 'os';
+import { dirname, join, resolve } from 'path';
 import { ProjectType, DetectedProject } from './project-detector';
+import { runConcurrently } from './async-utils';
 
 const execAsync = promisify(exec);
 
@@ -26,24 +28,30 @@ export interface BuildOptions {
 export class BuildPipeline {
   private static readonly BUILD_TIMEOUT = 300000; // 5 minutes
   private static readonly MAX_BUILD_SIZE = 100 * 1024 * 1024; // 100MB
+  private static readonly WRITE_CONCURRENCY = 32; // parallel file writes when staging the project
+  private static readonly MAX_LOG_LINES = 200; // most recent lines kept for the build result
 
   static async buildProject(options: BuildOptions): Promise<BuildResult> {
     const startTime = Date.now();
     const logs: string[] = [];
-    const tempDir = `/tmp/deployhub-build-${Date.now()}-${Math.random().toString(36).substr(2, 9)}`;
+    let tempDir = '';
 
     const addLog = (message: string) => {
       const timestamp = new Date().toISOString();
       logs.push(`[${timestamp}] ${message}`);
+      // Keep a rolling window so large projects don't return thousands of lines; the console keeps everything
+      if (logs.length > BuildPipeline.MAX_LOG_LINES) {
+        logs.shift();
+      }
       console.log(`[BUILD] ${message}`);
     };
 
     try {
       addLog(`Starting build for ${options.projectType.type} project: ${options.projectName}`);
-      addLog(`Using temporary directory: ${tempDir}`);
 
-      // Create temporary directory
-      await mkdir(tempDir, { recursive: true });
+      // Create a uniquely named temporary directory; BUILD_TMPDIR can point it at tmpfs (e.g. /dev/shm)
+      tempDir = await mkdtemp(join(process.env.BUILD_TMPDIR || tmpdir(), 'deployhub-build-'));
+      addLog(`Using temporary directory: ${tempDir}`);
 
       // Write files to temporary directory
       addLog('Writing project files...');
@@ -105,11 +113,13 @@ export class BuildPipeline {
       };
     } finally {
       // Cleanup temporary directory
-      try {
-        await rm(tempDir, { recursive: true, force: true });
-        addLog('Cleaned up temporary directory');
-      } catch (cleanupError) {
-        addLog(`Warning: Failed to cleanup temporary directory: ${cleanupError}`);
+      if (tempDir) {
+        try {
+          await rm(tempDir, { recursive: true, force: true });
+          addLog('Cleaned up temporary directory');
+        } catch (cleanupError) {
+          addLog(`Warning: Failed to cleanup temporary directory: ${cleanupError}`);
+        }
       }
     }
   }
@@ -119,21 +129,18 @@ export class BuildPipeline {
     files: { name: string; content: string }[], 
     addLog: (message: string) => void
   ): Promise<void> {
-    for (const file of files) {
-      const filePath = join(tempDir, file.name);
-      const dirPath = filePath.substring(0, filePath.lastIndexOf('/'));
-
-      // Create directory if it doesn't exist
-      if (dirPath !== tempDir) {
-        await mkdir(dirPath, { recursive: true });
-      }
+    // Create each distinct directory once up front, then write files in parallel
+    const dirPaths = new Set(files.map(file => dirname(join(tempDir, file.name))));
+    dirPaths.delete(tempDir);
+    await Promise.all([...dirPaths].map(dirPath => mkdir(dirPath, { recursive: true })));
 
+    await runConcurrently(files.values(), BuildPipeline.WRITE_CONCURRENCY, async (file) => {
       // Convert base64 content to buffer and write
       const buffer = Buffer.from(file.content, 'base64');
-      await writeFile(filePath, buffer);
-      
+      await writeFile(join(tempDir, file.name), buffer);
+
       addLog(`Written: ${file.name} (${buffer.length} bytes)`);
-    }
+    });
   }
 
   private static async installDependencies(
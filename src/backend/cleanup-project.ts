@@ -1,5 +1,103 @@
-import { S3Client, DeleteBucketCommand, ListObjectsV2Command, DeleteObjectCommand } from "@aws-sdk/client-s3";
-import { CloudFrontClient, DeleteDistributionCommand, ListDistributionsCommand } from "@aws-sdk/client-cloudfront";
+import { S3Client, DeleteBucketCommand, DeleteObjectsCommand, ObjectIdentifier, paginateListObjectsV2 } from "@aws-sdk/client-s3";
+import { CloudFrontClient, ListDistributionsCommand } from "@aws-sdk/client-cloudfront";
+import { getS3Client, getCloudFrontClient } from './aws-clients';
+import { runConcurrently } from './async-utils';
+import { DistributionCleanupStatus, teardownDistribution } from './cloudfront-teardown';
+
+// Maximum number of concurrent DeleteObjects batches while emptying a bucket
+const DELETE_CONCURRENCY = 16;
+// S3 accepts at most 1000 keys per DeleteObjects request
+const MAX_DELETE_BATCH = 1000;
+
+// Some S3-compatible providers time out on full 1000-key batches, so the size is tunable
+// per request (deleteBatchSize) or per deployment (S3_DELETE_BATCH_SIZE)
+export function resolveDeleteBatchSize(requested?: unknown): number {
+  const size = parseBatchSize(requested) ?? parseBatchSize(process.env.S3_DELETE_BATCH_SIZE) ?? MAX_DELETE_BATCH;
+  return Math.min(MAX_DELETE_BATCH, Math.max(1, Math.floor(size)));
+}
+
+// Only positive, finite numbers (or numeric strings) count; '', booleans, NaN and <= 0 are treated as unset
+function parseBatchSize(value: unknown): number | undefined {
+  if (typeof value !== 'number' && !(typeof value === 'string' && value.trim() !== '')) {
+    return undefined;
+  }
+  const size = Number(value);
+  return Number.isFinite(size) && size > 0 ? size : undefined;
+}
+
+// Delete one batch of objects (at most 1000) in one request and return the ones S3 reported as failed
+async function deleteObjectBatch(s3Client: S3Client, bucketName: string, objects: ObjectIdentifier[]): Promise<ObjectIdentifier[]> {
+  const deleteResult = await s3Client.send(new DeleteObjectsCommand({
+    Bucket: bucketName,
+    Delete: { Objects: objects, Quiet: true },
+  }));
+  return (deleteResult.Errors ?? []).map(error => ({ Key: error.Key!, VersionId: error.VersionId }));
+}
+
+// Empty and delete the project's S3 bucket, returning an error message on failure
+async function cleanupBucket(s3Client: S3Client, bucketName: string, batchSize: number): Promise<string | undefined> {
+  try {
+    // Delete all objects in bucket first, one DeleteObjects batch per listed page.
+    // Pages are pulled lazily, so listing overlaps with the in-flight deletes.
+    // Ask for the page size explicitly so each listed page fills exactly one delete batch
+    const pages = paginateListObjectsV2({ client: s3Client, pageSize: batchSize }, { Bucket: bucketName });
+    const failedObjects: ObjectIdentifier[] = [];
+    await runConcurrently(pages, DELETE_CONCURRENCY, async (page) => {
+      const objects = (page.Contents ?? []).map(obj => ({ Key: obj.Key! }));
+      if (objects.length > 0) {
+        failedObjects.push(...await deleteObjectBatch(s3Client, bucketName, objects));
+      }
+    });
+
+    // Retry keys S3 reported as failed once before giving up
+    const stillFailed: ObjectIdentifier[] = [];
+    for (let i = 0; i < failedObjects.length; i += batchSize) {
+      stillFailed.push(...await deleteObjectBatch(s3Client, bucketName, failedObjects.slice(i, i + batchSize)));
+    }
+    if (stillFailed.length > 0) {
+      throw new Error(`Failed to delete ${stillFailed.length} objects from ${bucketName}`);
+    }
+
+    // Delete the bucket
+    await s3Client.send(new DeleteBucketCommand({ Bucket: bucketName }));
+    console.log(`S3 bucket ${bucketName} deleted successfully`);
+    return undefined;
+  } catch (error) {
+    const errorMessage = error instanceof Error ? error.message : 'Unknown S3 error';
+    return `S3 cleanup failed: ${errorMessage}`;
+  }
+}
+
+// Look up a distribution created by DeployHub for this project when the caller has no recorded id.
+// Only an exact comment match counts, so a short project name can never select someone else's distribution.
+async function findDistributionByComment(cloudFrontClient: CloudFrontClient, projectName: string): Promise<string | undefined> {
+  const expectedComment = `DeployHub distribution for ${projectName}`;
+  const listDistributionsResult = await cloudFrontClient.send(new ListDistributionsCommand({}));
+  return listDistributionsResult.DistributionList?.Items?.find(distribution => distribution.Comment === expectedComment)?.Id;
+}
+
+// Disable the project's CloudFront distribution and delete it, in the background if the change still has to deploy
+async function cleanupDistribution(
+  cloudFrontClient: CloudFrontClient,
+  projectName: string,
+  requestedDistributionId?: string
+): Promise<{ distributionId?: string; status?: DistributionCleanupStatus; error?: string }> {
+  let distributionId = requestedDistributionId;
+
+  try {
+    if (!distributionId) {
+      distributionId = await findDistributionByComment(cloudFrontClient, projectName);
+      if (!distributionId) {
+        return {};
+      }
+    }
+    console.log(`Cleaning up CloudFront distribution ${distributionId} for project ${projectName}`);
+    return { distributionId, status: await teardownDistribution(cloudFrontClient, distributionId) };
+  } catch (error) {
+    const errorMessage = error instanceof Error ? error.message : 'Unknown CloudFront error';
+    return { distributionId, error: `CloudFront cleanup failed: ${errorMessage}` };
+  }
+}
 
 export interface CleanupRequest {
   projectName: string;
@@ -8,7 +106,10 @@ export interface CleanupRequest {
     secretAccessKey: string;
     sessionToken: string;
   };
+  bucketName?: string;
+  distributionId?: string;
   region?: string;
+  deleteBatchSize?: number;
 }
 
 export interface CleanupResult {
@@ -17,6 +118,7 @@ export interface CleanupResult {
   projectName: string;
   bucketName?: string;
   distributionId?: string;
+  distributionStatus?: DistributionCleanupStatus;
   errors?: string[];
 }
 
@@ -48,7 +150,7 @@ export async function cleanupProject(event: { httpMethod: string; body?: string
 
   try {
     // Parse request body
-    const { projectName, credentials, region = 'us-east-1' } = JSON.parse(event.body || '{}');
+    const { projectName, bucketName, distributionId: requestedDistributionId, credentials, region = 'us-east-1', deleteBatchSize } = JSON.parse(event.body || '{}');
 
     // Validate required parameters
     if (!projectName || !credentials) {
@@ -61,73 +163,17 @@ export async function cleanupProject(event: { httpMethod: string; body?: string
       };
     }
 
-    // Create S3 client
-    const s3Client = new S3Client({
-      region,
-      credentials: {
-        accessKeyId: credentials.accessKeyId,
-        secretAccessKey: credentials.secretAccessKey,
-        sessionToken: credentials.sessionToken,
-      },
-    });
-
-    // Create CloudFront client
-    const cloudFrontClient = new CloudFrontClient({
-      region,
-      credentials: {
-        accessKeyId: credentials.accessKeyId,
-        secretAccessKey: credentials.secretAccessKey,
-        sessionToken: credentials.sessionToken,
-      },
-    });
-
-    const errors: string[] = [];
-    let bucketName: string | undefined;
-    let distributionId: string | undefined;
-
-    // Find and delete S3 bucket
-    try {
-      // List buckets to find the project bucket
-      const bucketNamePattern = `deployhub-${projectName.toLowerCase().replace(/\s+/g, '-')}`;
-      
-      // Try to find bucket by pattern
-      const bucketName = `${bucketNamePattern}-${Date.now()}`;
-      
-      // Delete all objects in bucket first
-      const listObjectsResult = await s3Client.send(new ListObjectsV2Command({ Bucket: bucketName }));
-      
-      if (listObjectsResult.Contents && listObjectsResult.Contents.length > 0) {
-        const deletePromises = listObjectsResult.Contents.map(obj => 
-          s3Client.send(new DeleteObjectCommand({ Bucket: bucketName, Key: obj.Key! }))
-        );
-        await Promise.all(deletePromises);
-      }
-
-      // Delete the bucket
-      await s3Client.send(new DeleteBucketCommand({ Bucket: bucketName }));
-      console.log(`S3 bucket ${bucketName} deleted successfully`);
-    } catch (error) {
-      const errorMessage = error instanceof Error ? error.message : 'Unknown S3 error';
-      errors.push(`S3 cleanup failed: ${errorMessage}`);
-    }
+    // Reuse cached S3 and CloudFront clients for these credentials
+    const s3Client = getS3Client(region, credentials);
+    const cloudFrontClient = getCloudFrontClient(region, credentials);
 
-    // Find and delete CloudFront distribution
-    try {
-      const listDistributionsResult = await cloudFrontClient.send(new ListDistributionsCommand({}));
-      
-      if (listDistributionsResult.DistributionList?.Items) {
-        for (const distribution of listDistributionsResult.DistributionList.Items) {
-          if (distribution.Comment?.includes(projectName) || distribution.DomainName?.includes(projectName)) {
-            distributionId = distribution.Id;
-            console.log(`Found CloudFront distribution ${distributionId} for project ${projectName}`);
-            break;
-          }
-        }
-      }
-    } catch (error) {
-      const errorMessage = error instanceof Error ? error.message : 'Unknown CloudFront error';
-      errors.push(`CloudFront cleanup failed: ${errorMessage}`);
-    }
+    // S3 and CloudFront cleanup are independent, so run both concurrently
+    const [s3Error, cloudFrontResult] = await Promise.all([
+      bucketName ? cleanupBucket(s3Client, bucketName, resolveDeleteBatchSize(deleteBatchSize)) : undefined,
+      cleanupDistribution(cloudFrontClient, projectName, requestedDistributionId),
+    ]);
+    const { distributionId } = cloudFrontResult;
+    const errors = [s3Error, cloudFrontResult.error].filter((error): error is string => Boolean(error));
 
     return {
       statusCode: 200,
@@ -140,6 +186,7 @@ export async function cleanupProject(event: { httpMethod: string; body?: string
         projectName,
         bucketName,
         distributionId,
+        distributionStatus: cloudFrontResult.status,
         errors: errors.length > 0 ? errors : undefined
       })
     };
@@ -0,0 +1,66 @@
+import {
+  CloudFrontClient,
+  DeleteDistributionCommand,
+  GetDistributionCommand,
+  UpdateDistributionCommand,
+  waitUntilDistributionDeployed
+} from "@aws-sdk/client-cloudfront";
+
+export type DistributionCleanupStatus = 'deleted' | 'pending-deletion';
+
+// How long the background teardown waits for a disabled distribution to deploy before giving up
+const DISTRIBUTION_DEPLOY_WAIT_SECONDS = 30 * 60;
+
+// Distributions whose background teardown is still running, so a repeated call doesn't start a second one
+const pendingTeardowns = new Set<string>();
+
+// Wait for a disabled distribution to finish deploying, then delete it. Runs detached from the HTTP request.
+async function deleteWhenDeployed(cloudFrontClient: CloudFrontClient, distributionId: string, eTag?: string): Promise<void> {
+  pendingTeardowns.add(distributionId);
+  try {
+    await waitUntilDistributionDeployed(
+      { client: cloudFrontClient, minDelay: 15, maxDelay: 60, maxWaitTime: DISTRIBUTION_DEPLOY_WAIT_SECONDS },
+      { Id: distributionId }
+    );
+    // Deploying does not change the ETag, so the one returned when disabling is still valid
+    await cloudFrontClient.send(new DeleteDistributionCommand({ Id: distributionId, IfMatch: eTag }));
+    console.log(`CloudFront distribution ${distributionId} deleted successfully`);
+  } catch (error) {
+    console.error(`Failed to delete CloudFront distribution ${distributionId}:`, error);
+  } finally {
+    pendingTeardowns.delete(distributionId);
+  }
+}
+
+// Disable a distribution and delete it, finishing in the background if the change still has to deploy
+export async function teardownDistribution(cloudFrontClient: CloudFrontClient, distributionId: string): Promise<DistributionCleanupStatus> {
+  if (pendingTeardowns.has(distributionId)) {
+    return 'pending-deletion';
+  }
+
+  const { Distribution, ETag } = await cloudFrontClient.send(new GetDistributionCommand({ Id: distributionId }));
+  const enabled = Distribution?.DistributionConfig?.Enabled ?? false;
+
+  // CloudFront only deletes disabled distributions, so disable it first
+  let eTag = ETag;
+  if (enabled) {
+    const updateResult = await cloudFrontClient.send(new UpdateDistributionCommand({
+      Id: distributionId,
+      IfMatch: ETag,
+      DistributionConfig: { ...Distribution!.DistributionConfig!, Enabled: false },
+    }));
+    eTag = updateResult.ETag;
+    console.log(`CloudFront distribution ${distributionId} disabled`);
+  }
+
+  // Disabling takes minutes to propagate, so finish the teardown after responding rather than holding the request
+  if (enabled || Distribution?.Status !== 'Deployed') {
+    void deleteWhenDeployed(cloudFrontClient, distributionId, eTag);
+    console.log(`CloudFront distribution ${distributionId} will be deleted once the change has deployed`);
+    return 'pending-deletion';
+  }
+
+  await cloudFrontClient.send(new DeleteDistributionCommand({ Id: distributionId, IfMatch: eTag }));
+  console.log(`CloudFront distribution ${distributionId} deleted successfully`);
+  return 'deleted';
+}
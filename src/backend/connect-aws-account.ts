@@ -1,4 +1,5 @@
 import { STSClient, AssumeRoleCommand, GetCallerIdentityCommand } from "@aws-sdk/client-sts";
+import { getSTSClient } from './aws-clients';
 
 // AWS Lambda handler for AWS account connection verification
 export async function connectAWSAccount(event: { httpMethod: string; body?: string }): Promise<{ statusCode: number; headers: Record<string, string>; body: string }> {
@@ -66,10 +67,8 @@ export async function connectAWSAccount(event: { httpMethod: string; body?: stri
       };
     }
 
-    // Create STS client using the Lambda's IAM role
-    const stsClient = new STSClient({ 
-      region: process.env.AWS_REGION || 'us-east-1'
-    });
+    // Reuse the STS client for the Lambda's IAM role
+    const stsClient = getSTSClient(process.env.AWS_REGION || 'us-east-1');
 
     // Step 1: Verify that we can assume the role (test the trust relationship)
     try {
@@ -0,0 +1,59 @@
+import { extname } from 'path';
+
+// Content types for static site assets, keyed by lower-case file extension
+const CONTENT_TYPES: Record<string, string> = {
+  '.html': 'text/html',
+  '.htm': 'text/html',
+  '.css': 'text/css',
+  '.js': 'application/javascript',
+  '.mjs': 'application/javascript',
+  '.json': 'application/json',
+  '.png': 'image/png',
+  '.jpg': 'image/jpeg',
+  '.jpeg': 'image/jpeg',
+  '.gif': 'image/gif',
+  '.svg': 'image/svg+xml',
+  '.ico': 'image/x-icon',
+  '.webp': 'image/webp',
+  '.woff': 'font/woff',
+  '.woff2': 'font/woff2',
+  '.txt': 'text/plain',
+  '.xml': 'application/xml',
+  '.pdf': 'application/pdf',
+  '.zip': 'application/zip',
+};
+
+const DEFAULT_CONTENT_TYPE = 'application/octet-stream';
+
+// HTML must revalidate so a new deploy shows up immediately; every other asset
+// lives at a per-deploy bucket/distribution URL and can be cached for a year
+const HTML_CACHE_CONTROL = 'public, max-age=0, must-revalidate';
+const ASSET_CACHE_CONTROL = 'public, max-age=31536000, immutable';
+
+export interface ObjectMetadata {
+  contentType: string;
+  cacheControl: string;
+}
+
+// Content type and cache policy resolved together so each key is classified once
+const OBJECT_METADATA: Record<string, ObjectMetadata> = Object.fromEntries(
+  Object.entries(CONTENT_TYPES).map(([ext, contentType]) => [
+    ext,
+    { contentType, cacheControl: contentType === 'text/html' ? HTML_CACHE_CONTROL : ASSET_CACHE_CONTROL },
+  ])
+);
+
+const DEFAULT_OBJECT_METADATA: ObjectMetadata = {
+  contentType: DEFAULT_CONTENT_TYPE,
+  cacheControl: ASSET_CACHE_CONTROL,
+};
+
+// Helper function to determine content type
+export function getContentType(filename: string): string {
+  return CONTENT_TYPES[extname(filename).toLowerCase()] ?? DEFAULT_CONTENT_TYPE;
+}
+
+// Content type and Cache-Control header for an uploaded object
+export function getObjectMetadata(filename: string): ObjectMetadata {
+  return OBJECT_METADATA[extname(filename).toLowerCase()] ?? DEFAULT_OBJECT_METADATA;
+}
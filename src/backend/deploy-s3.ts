@@ -1,20 +1,21 @@
 import {
-  S3Client,
   CreateBucketCommand,
   PutBucketWebsiteCommand,
   PutBucketPolicyCommand,
   PutBucketCorsCommand,
   PutObjectCommand,
-  PutPublicAccessBlockCommand
+  PutPublicAccessBlockCommand,
+  waitUntilBucketExists
 } from "@aws-sdk/client-s3";
 import {
-  CloudFrontClient,
   CreateDistributionCommand,
   CreateInvalidationCommand,
   GetDistributionCommand
 } from "@aws-sdk/client-cloudfront";
 import * as unzipper from 'unzipper';
 import { Readable } from 'stream';
+import { getS3Client, getCloudFrontClient } from './aws-clients';
+import { getContentType } from './content-types';
 
 // AWS Lambda handler for S3 deployment
 export async function deployToS3(event: { httpMethod: string; body?: string }): Promise<{ statusCode: number; headers: Record<string, string>; body: string }> {
@@ -64,25 +65,9 @@ export async function deployToS3(event: { httpMethod: string; body?: string }):
       };
     }
 
-    // Create S3 client using provided credentials
-    const s3Client = new S3Client({
-      region,
-      credentials: {
-        accessKeyId: credentials.accessKeyId,
-        secretAccessKey: credentials.secretAccessKey,
-        sessionToken: credentials.sessionToken,
-      },
-    });
-
-    // Create CloudFront client
-    const cloudFrontClient = new CloudFrontClient({
-      region,
-      credentials: {
-        accessKeyId: credentials.accessKeyId,
-        secretAccessKey: credentials.secretAccessKey,
-        sessionToken: credentials.sessionToken,
-      },
-    });
+    // Reuse cached S3 and CloudFront clients for these credentials
+    const s3Client = getS3Client(region, credentials);
+    const cloudFrontClient = getCloudFrontClient(region, credentials);
 
     // Generate unique bucket name
     const timestamp = Date.now();
@@ -94,8 +79,8 @@ export async function deployToS3(event: { httpMethod: string; body?: string }):
         await s3Client.send(new CreateBucketCommand({ Bucket: bucketName }));
         console.log("S3 bucket created successfully");
         
-        // Wait for bucket to be available
-        await new Promise(resolve => setTimeout(resolve, 5000));
+        // Wait for bucket to be available; returns as soon as HeadBucket succeeds
+        await waitUntilBucketExists({ client: s3Client, minDelay: 1, maxWaitTime: 30 }, { Bucket: bucketName });
         
         // Disable block public access settings to allow public read policies
         console.log("Disabling block public access settings...");
@@ -138,9 +123,6 @@ export async function deployToS3(event: { httpMethod: string; body?: string }):
     }));
     console.log("CORS policy configured successfully");
 
-    // Wait for CORS to propagate
-    await new Promise(resolve => setTimeout(resolve, 3000));
-
     // Configure static website hosting
     await s3Client.send(new PutBucketWebsiteCommand({
       Bucket: bucketName,
@@ -230,10 +212,7 @@ export async function deployToS3(event: { httpMethod: string; body?: string }):
 
     console.log(`CloudFront distribution created: ${distributionId}`);
 
-    // Wait a reasonable time for CloudFront to start propagating
-    console.log("Waiting for CloudFront distribution to start propagating...");
-    await new Promise(resolve => setTimeout(resolve, 15000)); // Wait 15 seconds
-    console.log("CloudFront distribution created, continuing with deployment...");
+    // Uploads go to the S3 origin, so they don't need to wait for the distribution to propagate
 
     // Upload files to S3
     console.log("Uploading project files to S3...");
@@ -336,24 +315,3 @@ export async function deployToS3(event: { httpMethod: string; body?: string }):
     };
   }
 };
-
-// Helper function to determine content type
-function getContentType(filename: string): string {
-  const ext = filename.toLowerCase().split('.').pop();
-  switch (ext) {
-    case 'html': return 'text/html';
-    case 'css': return 'text/css';
-    case 'js': return 'application/javascript';
-    case 'json': return 'application/json';
-    case 'png': return 'image/png';
-    case 'jpg':
-    case 'jpeg': return 'image/jpeg';
-    case 'gif': return 'image/gif';
-    case 'svg': return 'image/svg+xml';
-    case 'ico': return 'image/x-icon';
-    case 'txt': return 'text/plain';
-    case 'xml': return 'application/xml';
-    case 'pdf': return 'application/pdf';
-    default: return 'application/octet-stream';
-  }
-}
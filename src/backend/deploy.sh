@@ -29,12 +29,14 @@ npm run build
 echo "📦 Creating deployment packages..."
 cp dist/assume-role.js .
 cp dist/connect-aws-account.js .
+cp dist/aws-clients.js .
+cp dist/lru.js .
 
-# Package assume-role function
-zip -r deployhub-assume-role.zip assume-role.js node_modules/
+# Package assume-role function (with the shared client module it imports)
+zip -r deployhub-assume-role.zip assume-role.js aws-clients.js lru.js node_modules/
 
 # Package connect-aws-account function  
-zip -r deployhub-connect-aws.zip connect-aws-account.js node_modules/
+zip -r deployhub-connect-aws.zip connect-aws-account.js aws-clients.js lru.js node_modules/
 
 # Get current AWS account ID
 ACCOUNT_ID=$(aws sts get-caller-identity --query Account --output text)
@@ -337,4 +339,4 @@ echo "     -H 'Content-Type: application/json' \\"
 echo "     -d '{\"roleArn\":\"arn:aws:iam::USER_ACCOUNT:role/DeployHubRole\",\"externalId\":\"deployhub-trusted-service\",\"userId\":\"test\"}'"
 
 # Cleanup
-rm -f trust-policy.json role-policy.json deployhub-assume-role.zip deployhub-connect-aws.zip assume-role.js connect-aws-account.js
+rm -f trust-policy.json role-policy.json deployhub-assume-role.zip deployhub-connect-aws.zip assume-role.js connect-aws-account.js aws-clients.js lru.js
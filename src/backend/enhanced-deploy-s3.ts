@@ -1,25 +1,36 @@
 import {
-  S3Client,
   CreateBucketCommand,
   PutBucketWebsiteCommand,
   PutBucketPolicyCommand,
   PutBucketCorsCommand,
-  PutObjectCommand,
   PutPublicAccessBlockCommand,
-  ListObjectsV2Command
+  ListObjectsV2Command,
+  waitUntilBucketExists
 } from "@aws-sdk/client-s3";
 import {
-  CloudFrontClient,
   CreateDistributionCommand,
   CreateInvalidationCommand,
-  GetDistributionCommand
+  GetDistributionCommand,
+  DefaultCacheBehavior,
+  DistributionConfig
 } from "@aws-sdk/client-cloudfront";
 import * as unzipper from 'unzipper';
 import { Readable } from 'stream';
-import { readdir, stat } from 'fs/promises';
+import { readdir, readFile } from 'fs/promises';
 import { join } from 'path';
 import { ProjectDetector, DetectedProject } from './project-detector';
 import { BuildPipeline, BuildResult } from './build-pipeline';
+import { runConcurrently } from './async-utils';
+import { teardownDistribution } from './cloudfront-teardown';
+import { uploadObject } from './s3-upload';
+import { getS3Client, getCloudFrontClient } from './aws-clients';
+import { getObjectMetadata } from './content-types';
+
+// Uploaded files arrive base64-encoded; build output is passed through as raw bytes
+export interface DeployFile {
+  name: string;
+  content: string | Buffer;
+}
 
 export interface EnhancedDeploymentResult {
   success: boolean;
@@ -176,8 +187,8 @@ export async function deployToS3Enhanced(event: { httpMethod: string; body?: str
 }
 
 // Convert build output directory to files array
-async function convertBuildOutputToFiles(outputDir: string): Promise<{ name: string; content: string }[]> {
-  const files: { name: string; content: string }[] = [];
+async function convertBuildOutputToFiles(outputDir: string): Promise<DeployFile[]> {
+  const files: DeployFile[] = [];
   
   try {
     await processDirectory(outputDir, '', files);
@@ -188,7 +199,7 @@ async function convertBuildOutputToFiles(outputDir: string): Promise<{ name: str
   }
 }
 
-async function processDirectory(dirPath: string, relativePath: string, files: { name: string; content: string }[]): Promise<void> {
+async function processDirectory(dirPath: string, relativePath: string, files: DeployFile[]): Promise<void> {
   const entries = await readdir(dirPath, { withFileTypes: true });
   
   for (const entry of entries) {
@@ -199,16 +210,12 @@ async function processDirectory(dirPath: string, relativePath: string, files: {
       await processDirectory(fullPath, fileRelativePath, files);
     } else if (entry.isFile()) {
       try {
-        const fileStats = await stat(fullPath);
-        const fileBuffer = await import('fs').then(fs => fs.promises.readFile(fullPath));
-        const base64Content = fileBuffer.toString('base64');
-        
+        const fileBuffer = await readFile(fullPath);
+
         files.push({
           name: fileRelativePath,
-          content: base64Content
+          content: fileBuffer
         });
-        
-        console.log(`📄 Added file: ${fileRelativePath} (${fileStats.size} bytes)`);
       } catch (fileError) {
         console.warn(`⚠️ Failed to process file ${fileRelativePath}:`, fileError);
       }
@@ -219,7 +226,7 @@ async function processDirectory(dirPath: string, relativePath: string, files: {
 // Core S3 deployment logic (extracted from original deploy-s3.ts)
 async function deployToS3Core(
   projectName: string,
-  files: { name: string; content: string }[],
+  files: DeployFile[],
   domain: string | undefined,
   credentials: any,
   region: string
@@ -232,25 +239,9 @@ async function deployToS3Core(
   message?: string;
 }> {
   try {
-    // Create S3 client using provided credentials
-    const s3Client = new S3Client({
-      region,
-      credentials: {
-        accessKeyId: credentials.accessKeyId,
-        secretAccessKey: credentials.secretAccessKey,
-        sessionToken: credentials.sessionToken,
-      },
-    });
-
-    // Create CloudFront client
-    const cloudFrontClient = new CloudFrontClient({
-      region,
-      credentials: {
-        accessKeyId: credentials.accessKeyId,
-        secretAccessKey: credentials.secretAccessKey,
-        sessionToken: credentials.sessionToken,
-      },
-    });
+    // Reuse cached S3 and CloudFront clients for these credentials
+    const s3Client = getS3Client(region, credentials);
+    const cloudFrontClient = getCloudFrontClient(region, credentials);
 
     // Generate unique bucket name
     const timestamp = Date.now();
@@ -261,9 +252,9 @@ async function deployToS3Core(
     // Create S3 bucket
     await s3Client.send(new CreateBucketCommand({ Bucket: bucketName }));
     console.log("✅ S3 bucket created successfully");
-    
-    // Wait for bucket to be available
-    await new Promise(resolve => setTimeout(resolve, 5000));
+
+    // Wait for bucket to be available; returns as soon as HeadBucket succeeds
+    await waitUntilBucketExists({ client: s3Client, minDelay: 1, maxWaitTime: 30 }, { Bucket: bucketName });
     
     // Disable block public access settings to allow public read policies
     await s3Client.send(new PutPublicAccessBlockCommand({
@@ -285,22 +276,9 @@ async function deployToS3Core(
     }));
 
     // Set bucket policy to allow public read access
-    const bucketPolicy = {
-      Version: '2012-10-17',
-      Statement: [
-        {
-          Sid: 'PublicReadGetObject',
-          Effect: 'Allow',
-          Principal: '*',
-          Action: 's3:GetObject',
-          Resource: `arn:aws:s3:::${bucketName}/*`,
-        },
-      ],
-    };
-
     await s3Client.send(new PutBucketPolicyCommand({
       Bucket: bucketName,
-      Policy: JSON.stringify(bucketPolicy),
+      Policy: buildPublicReadPolicy(bucketName),
     }));
 
     // Configure CORS
@@ -321,98 +299,49 @@ async function deployToS3Core(
 
     console.log("✅ S3 bucket configured for static website hosting");
 
+    // Create CloudFront distribution while the files upload; it only needs the bucket's website endpoint
+    console.log("☁️ Creating CloudFront distribution...");
+
+    const distributionRequest = cloudFrontClient.send(new CreateDistributionCommand({
+      DistributionConfig: buildDistributionConfig(projectName, bucketName, region),
+    }));
+    // An upload failure is reported first; don't leave this promise's rejection unhandled meanwhile
+    distributionRequest.catch(() => undefined);
+
     // Upload files to S3
     console.log(`📤 Uploading ${files.length} files to S3...`);
-    
-    for (const file of files) {
-      try {
-        // Convert base64 to buffer
-        const fileBuffer = Buffer.from(file.content, 'base64');
-        
-        if (file.name.toLowerCase().endsWith('.zip')) {
-          // Handle ZIP file - extract and upload contents
-          console.log(`📦 Extracting ZIP file: ${file.name}`);
-          
-          const entries = await unzipper.Open.buffer(fileBuffer);
-          
-          for (const entry of entries.files) {
-            if (!entry.type || entry.type === 'File') {
-              const content = await entry.buffer();
-              const key = entry.path;
-              
-              // Skip hidden files and directories
-              if (key.startsWith('__MACOSX/') || key.startsWith('.DS_Store') || key.includes('/.')) {
-                continue;
-              }
-              
-              console.log(`📄 Uploading extracted file: ${key}`);
-              
-              await s3Client.send(new PutObjectCommand({
-                Bucket: bucketName,
-                Key: key,
-                Body: content,
-                ContentType: getContentType(key),
-              }));
-              
-              console.log(`✅ Successfully uploaded: ${key}`);
-            }
-          }
-        } else {
-          // Handle regular file
-          await s3Client.send(new PutObjectCommand({
+
+    let uploadedCount = 0;
+    try {
+      await runConcurrently(expandUploads(files), UPLOAD_CONCURRENCY, async ({ key, body }) => {
+        const { contentType, cacheControl } = getObjectMetadata(key);
+        try {
+          await uploadObject(s3Client, {
             Bucket: bucketName,
-            Key: file.name,
-            Body: fileBuffer,
-            ContentType: getContentType(file.name),
-          }));
-          
-          console.log(`✅ Successfully uploaded: ${file.name}`);
+            Key: key,
+            Body: body,
+            ContentType: contentType,
+            CacheControl: cacheControl,
+          });
+          uploadedCount++;
+        } catch (error) {
+          console.error(`❌ Failed to upload ${key}:`, error);
+          throw new Error(`Failed to upload ${key}: ${error instanceof Error ? error.message : 'Unknown error'}`);
         }
-      } catch (error) {
-        console.error(`❌ Failed to process ${file.name}:`, error);
-        throw new Error(`Failed to process ${file.name}: ${error instanceof Error ? error.message : 'Unknown error'}`);
+      });
+    } catch (error) {
+      // A failed deploy is never recorded, so don't leave a live distribution serving a half-filled bucket
+      const createdDistributionId = await distributionRequest.then(result => result.Distribution?.Id, () => undefined);
+      if (createdDistributionId) {
+        await teardownDistribution(cloudFrontClient, createdDistributionId).catch(teardownError => {
+          console.warn(`⚠️ Failed to tear down CloudFront distribution ${createdDistributionId}:`, teardownError);
+        });
       }
+      throw error;
     }
+    console.log(`✅ Uploaded ${uploadedCount} objects to S3`);
 
-    // Create CloudFront distribution
-    console.log("☁️ Creating CloudFront distribution...");
-    
-    const distributionResult = await cloudFrontClient.send(new CreateDistributionCommand({
-      DistributionConfig: {
-        CallerReference: `${projectName}-${Date.now()}`,
-        Comment: `DeployHub distribution for ${projectName}`,
-        DefaultRootObject: 'index.html',
-        Origins: {
-          Quantity: 1,
-          Items: [
-            {
-              Id: 'S3-Origin',
-              DomainName: `${bucketName}.s3-website-${region}.amazonaws.com`,
-              CustomOriginConfig: {
-                HTTPPort: 80,
-                HTTPSPort: 443,
-                OriginProtocolPolicy: 'http-only',
-              },
-            },
-          ],
-        },
-        DefaultCacheBehavior: {
-          TargetOriginId: 'S3-Origin',
-          ViewerProtocolPolicy: 'redirect-to-https',
-          AllowedMethods: {
-            Quantity: 2,
-            Items: ['GET', 'HEAD'],
-          },
-          Compress: true,
-          ForwardedValues: {
-            QueryString: false,
-            Cookies: { Forward: 'none' },
-          },
-        },
-        Enabled: true,
-        PriceClass: 'PriceClass_100',
-      },
-    }));
+    const distributionResult = await distributionRequest;
 
     const distributionId = distributionResult.Distribution?.Id;
     const domainName = distributionResult.Distribution?.DomainName;
@@ -459,37 +388,100 @@ async function deployToS3Core(
   }
 }
 
-// Helper function to determine content type
-function getContentType(filename: string): string {
-  const ext = filename.toLowerCase().split('.').pop();
-  switch (ext) {
-    case 'html':
-    case 'htm':
-      return 'text/html';
-    case 'css':
-      return 'text/css';
-    case 'js':
-      return 'application/javascript';
-    case 'json':
-      return 'application/json';
-    case 'png':
-      return 'image/png';
-    case 'jpg':
-    case 'jpeg':
-      return 'image/jpeg';
-    case 'gif':
-      return 'image/gif';
-    case 'svg':
-      return 'image/svg+xml';
-    case 'ico':
-      return 'image/x-icon';
-    case 'txt':
-      return 'text/plain';
-    case 'pdf':
-      return 'application/pdf';
-    case 'zip':
-      return 'application/zip';
-    default:
-      return 'application/octet-stream';
+// CloudFront settings shared by every deployment; only the origin and caller reference vary
+const ORIGIN_ID = 'S3-Origin';
+
+const DEFAULT_CACHE_BEHAVIOR: DefaultCacheBehavior = {
+  TargetOriginId: ORIGIN_ID,
+  ViewerProtocolPolicy: 'redirect-to-https',
+  AllowedMethods: {
+    Quantity: 2,
+    Items: ['GET', 'HEAD'],
+  },
+  Compress: true,
+  ForwardedValues: {
+    QueryString: false,
+    Cookies: { Forward: 'none' },
+  },
+};
+
+function buildDistributionConfig(projectName: string, bucketName: string, region: string): DistributionConfig {
+  return {
+    CallerReference: `${projectName}-${Date.now()}`,
+    Comment: `DeployHub distribution for ${projectName}`,
+    DefaultRootObject: 'index.html',
+    Origins: {
+      Quantity: 1,
+      Items: [
+        {
+          Id: ORIGIN_ID,
+          DomainName: `${bucketName}.s3-website-${region}.amazonaws.com`,
+          CustomOriginConfig: {
+            HTTPPort: 80,
+            HTTPSPort: 443,
+            OriginProtocolPolicy: 'http-only',
+          },
+        },
+      ],
+    },
+    DefaultCacheBehavior: DEFAULT_CACHE_BEHAVIOR,
+    Enabled: true,
+    PriceClass: 'PriceClass_100',
+  };
+}
+
+function buildPublicReadPolicy(bucketName: string): string {
+  return JSON.stringify({
+    Version: '2012-10-17',
+    Statement: [
+      {
+        Sid: 'PublicReadGetObject',
+        Effect: 'Allow',
+        Principal: '*',
+        Action: 's3:GetObject',
+        Resource: `arn:aws:s3:::${bucketName}/*`,
+      },
+    ],
+  });
+}
+
+// Maximum number of concurrent S3 uploads per deployment
+const UPLOAD_CONCURRENCY = 16;
+
+// Yield one S3 upload per file, extracting ZIP archives lazily as the upload pool pulls entries
+async function* expandUploads(files: DeployFile[]): AsyncGenerator<{ key: string; body: Buffer }> {
+  for (const file of files) {
+    const processError = (error: unknown) => {
+      console.error(`❌ Failed to process ${file.name}:`, error);
+      throw new Error(`Failed to process ${file.name}: ${error instanceof Error ? error.message : 'Unknown error'}`);
+    };
+
+    // Convert base64 to buffer; build output is already binary
+    const fileBuffer = typeof file.content === 'string' ? Buffer.from(file.content, 'base64') : file.content;
+
+    if (!file.name.toLowerCase().endsWith('.zip')) {
+      // Handle regular file
+      yield { key: file.name, body: fileBuffer };
+      continue;
+    }
+
+    // Handle ZIP file - extract and upload contents
+    console.log(`📦 Extracting ZIP file: ${file.name}`);
+    const archive = await unzipper.Open.buffer(fileBuffer).catch(processError);
+
+    for (const entry of archive.files) {
+      if (entry.type && entry.type !== 'File') {
+        continue;
+      }
+
+      const key = entry.path;
+
+      // Skip hidden files and directories
+      if (key.startsWith('__MACOSX/') || key.startsWith('.DS_Store') || key.includes('/.')) {
+        continue;
+      }
+
+      yield { key, body: await entry.buffer().catch(processError) };
+    }
   }
 }
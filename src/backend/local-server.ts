@@ -1,9 +1,6 @@
 import express from 'express';
 import cors from 'cors';
 import { createClient } from '@supabase/supabase-js';
-import { deployToS3 } from './deploy-s3';
-import { deployToS3Enhanced } from './enhanced-deploy-s3';
-import { cleanupProject } from './cleanup-project';
 
 // Define proper types for the Lambda-style handlers
 interface LambdaEvent {
@@ -18,8 +15,24 @@ interface LambdaResponse {
   body: string;
 }
 
+type LambdaHandler = (event: LambdaEvent) => Promise<LambdaResponse>;
+
+// Defer loading a handler module (and the AWS SDK clients it pulls in) until its first request
+const lazyHandler = (load: () => Promise<LambdaHandler>): LambdaHandler => {
+  let handler: Promise<LambdaHandler> | undefined;
+  return async (event) => {
+    if (!handler) {
+      handler = load().catch((error) => {
+        handler = undefined;
+        throw error;
+      });
+    }
+    return (await handler)(event);
+  };
+};
+
 // Convert Lambda-style handlers to Express middleware
-const lambdaToExpress = (lambdaHandler: (event: LambdaEvent) => Promise<LambdaResponse>) => {
+const lambdaToExpress = (lambdaHandler: LambdaHandler) => {
   return async (req: express.Request, res: express.Response) => {
     try {
       // Convert Express request to Lambda event format
@@ -65,12 +78,18 @@ app.get('/health', (req, res) => {
   res.json({ status: 'healthy', timestamp: new Date().toISOString() });
 });
 
-// Deploy endpoints
-app.post('/deploy-s3', lambdaToExpress(deployToS3));
-app.post('/deploy-s3-enhanced', lambdaToExpress(deployToS3Enhanced));
-
-// Cleanup endpoint
-app.post('/cleanup-project', lambdaToExpress(cleanupProject));
+// Lambda-style handlers, converted once and mounted from a single route table
+const lambdaRoutes: Array<[string, LambdaHandler]> = [
+  // Deploy endpoints
+  ['/deploy-s3', lazyHandler(() => import('./deploy-s3').then(m => m.deployToS3))],
+  ['/deploy-s3-enhanced', lazyHandler(() => import('./enhanced-deploy-s3').then(m => m.deployToS3Enhanced))],
+  // Cleanup endpoint
+  ['/cleanup-project', lazyHandler(() => import('./cleanup-project').then(m => m.cleanupProject))],
+];
+
+for (const [path, handler] of lambdaRoutes) {
+  app.post(path, lambdaToExpress(handler));
+}
 
 // Analytics endpoint - fetches real CloudWatch metrics
 app.get('/api/analytics/:projectId', async (req, res) => {
@@ -184,7 +203,7 @@ app.get('/api/environment-variables/:projectId', async (req, res) => {
     // Fetch from Supabase database
     const { data, error } = await supabase
       .from('environment_variables')
-      .select('*')
+      .select('id, key, value, is_secret, environment, updated_at')
       .eq('project_id', projectId)
       .order('created_at', { ascending: false });
 
@@ -321,7 +340,7 @@ app.delete('/api/environment-variables/:projectId/:variableId', async (req, res)
 
 
 // Start server
-app.listen(Number(PORT), HOST, () => {
+const server = app.listen(Number(PORT), HOST, () => {
   console.log(`🚀 DeployHub Backend Server running on ${HOST}:${PORT}`);
   console.log(`📝 Deploy endpoint: http://${HOST}:${PORT}/deploy-s3`);
   console.log(`🧹 Cleanup endpoint: http://${HOST}:${PORT}/cleanup-project`);
@@ -329,3 +348,8 @@ app.listen(Number(PORT), HOST, () => {
   console.log(`⚡ Performance endpoint: http://${HOST}:${PORT}/api/performance/:projectId`);
   console.log(`❤️  Health check: http://${HOST}:${PORT}/health`);
 });
+
+// Reuse idle client connections between requests and cap concurrent sockets
+server.keepAliveTimeout = 30000;
+server.headersTimeout = 31000; // must exceed keepAliveTimeout
+server.maxConnections = 1000;
@@ -0,0 +1,64 @@
+import {
+  S3Client,
+  PutObjectCommand,
+  CreateMultipartUploadCommand,
+  UploadPartCommand,
+  CompleteMultipartUploadCommand,
+  AbortMultipartUploadCommand,
+  CompletedPart
+} from "@aws-sdk/client-s3";
+import { runConcurrently } from './async-utils';
+
+export interface UploadObjectParams {
+  Bucket: string;
+  Key: string;
+  Body: Buffer;
+  ContentType?: string;
+  CacheControl?: string;
+}
+
+// Objects at or above this size are sent as a multipart upload with parts in parallel
+const MULTIPART_THRESHOLD = 8 * 1024 * 1024; // 8MB
+const MULTIPART_PART_SIZE = 16 * 1024 * 1024; // 16MB (S3 minimum is 5MB)
+const MULTIPART_CONCURRENCY = 4;
+
+// Upload a single object, using PutObject for small bodies and multipart for large ones
+export async function uploadObject(s3Client: S3Client, params: UploadObjectParams): Promise<void> {
+  if (params.Body.length < MULTIPART_THRESHOLD) {
+    await s3Client.send(new PutObjectCommand(params));
+    return;
+  }
+
+  const { Body: body, ...objectParams } = params;
+  const { Bucket, Key } = objectParams;
+  const { UploadId } = await s3Client.send(new CreateMultipartUploadCommand(objectParams));
+
+  const partCount = Math.ceil(body.length / MULTIPART_PART_SIZE);
+  const parts: CompletedPart[] = new Array(partCount);
+  const partIndexes = Array.from({ length: partCount }, (_, index) => index).values();
+
+  try {
+    await runConcurrently(partIndexes, MULTIPART_CONCURRENCY, async (index) => {
+      const start = index * MULTIPART_PART_SIZE;
+      const { ETag } = await s3Client.send(new UploadPartCommand({
+        Bucket,
+        Key,
+        UploadId,
+        PartNumber: index + 1,
+        Body: body.subarray(start, start + MULTIPART_PART_SIZE),
+      }));
+      parts[index] = { ETag, PartNumber: index + 1 };
+    });
+
+    await s3Client.send(new CompleteMultipartUploadCommand({
+      Bucket,
+      Key,
+      UploadId,
+      MultipartUpload: { Parts: parts },
+    }));
+  } catch (error) {
+    // Don't leave orphaned parts behind (they are billed until aborted)
+    await s3Client.send(new AbortMultipartUploadCommand({ Bucket, Key, UploadId })).catch(() => undefined);
+    throw error;
+  }
+}